@@ -1,11 +1,26 @@
 """Demo FastHTML application for the JSON Schema to UI library."""
 
-import json
+import gzip
+import hashlib
+import html
+import inspect
+import math
+import os
 import sys
 import argparse
+import ast
+import asyncio
+from functools import lru_cache, partial
 from pathlib import Path
 import webbrowser
+import brotli
+import orjson
+import uvicorn
 from fasthtml.common import *
+from fasthtml.core import flat_xt
+from starlette.middleware import Middleware
+from starlette.routing import Route
+from jsonschema.validators import validator_for
 from cjm_fasthtml_daisyui.core.resources import get_daisyui_headers
 from cjm_fasthtml_daisyui.core.testing import create_theme_selector
 from cjm_fasthtml_daisyui.components.navigation.navbar import navbar, navbar_start, navbar_center, navbar_end
@@ -19,10 +34,39 @@ from cjm_fasthtml_tailwind.utilities.typography import font_size, font_weight
 from cjm_fasthtml_tailwind.core.base import combine_classes
 
 # Import our library
+from cjm_fasthtml_jsonschema.core.parser import SchemaParser
 from cjm_fasthtml_jsonschema.generators.form import generate_form_ui
 
 static_path = Path(__file__).absolute().parent
 
+
+class StaticCacheMiddleware:
+    """ASGI middleware that marks responses under `/static/` as long-lived and immutable."""
+
+    def __init__(self, app, max_age=31536000):
+        self.app = app
+        self.cache_control = f"public, max-age={max_age}, immutable".encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/static/"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message):
+            if message["type"] == "http.response.start" and message["status"] in (200, 304):
+                headers = [*message.get("headers", []), (b"cache-control", self.cache_control)]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
+
+
+def static_url(name):
+    """URL for a file in `./static/`, versioned by content hash so it can be cached indefinitely."""
+    digest = hashlib.sha256((static_path / "static" / name).read_bytes()).hexdigest()[:12]
+    return f"/static/{name}?v={digest}"
+
+
 # Create the FastHTML app with DaisyUI headers
 APP_ID = "jschema"
 
@@ -33,44 +77,159 @@ app, rt = fast_app(
     static_path=str(static_path),
     session_cookie=f'session_{APP_ID}_',
     secret_key=f'{APP_ID}-demo-secret',
+    middleware=[Middleware(StaticCacheMiddleware)],
 )
 
-app.hdrs.append(Link(rel='icon', type='image/png', href='/static/layout-template.png'))  # for PNG
+app.hdrs.append(Link(rel='icon', type='image/png', href=static_url('layout-template.png')))  # for PNG
 
 
-# Global variable to store schema path
-SCHEMA_PATH = None
+# Page class strings are constant, so combine them once at import time
+_TITLE_CLS = combine_classes(
+    font_size.lg,          # Smaller on mobile
+    font_size.xl.sm,       # Medium on small screens
+    font_size._2xl.md,     # Large on medium+ screens
+    font_weight.bold,
+    text_dui.base_content
+)
+_NAVBAR_START_CLS = str(navbar_start)
+_NAVBAR_END_CLS = combine_classes(
+    flex_display,
+    justify.end,
+    items.center,
+    gap(2),               # Smaller gap on mobile
+    gap(4).sm,            # Normal gap on small+
+    navbar_end
+)
+_NAVBAR_CLS = combine_classes(navbar, bg_dui.base_100, p(0))
+_INTRO_CLS = combine_classes(font_size.lg, m.b(8))
+_BTN_PRIMARY_CLS = combine_classes(btn, btn_colors.primary)
+_BTN_GHOST_CLS = combine_classes(btn, btn_styles.ghost, m.l(2))
+_SECTION_CLS = combine_classes(m.t(6))
+_CONTAINER_CLS = combine_classes(container, max_w._6xl, m.x.auto, p(6))
+_RESULT_TITLE_CLS = combine_classes(font_weight.bold, m.b(2))
+_RESULT_PRE_CLS = combine_classes(bg_dui.base_100, p(4), "rounded-lg", "overflow-auto")
+_RESULT_CLS = combine_classes(bg_dui.success.opacity(10), "border", "border-success", p(4), "rounded-lg")
+_ERROR_CLS = combine_classes(bg_dui.error.opacity(10), "border", "border-error", p(4), "rounded-lg")
+
+
+# Schema path, passed through the environment so uvicorn worker processes see it too
+SCHEMA_PATH_ENV = "JSONSCHEMA_DEMO_SCHEMA"
+SCHEMA_PATH = os.environ.get(SCHEMA_PATH_ENV)
+
+def get_schema_stamp(path):
+    """Identify the current version of a schema file by its path and modification time."""
+    schema_path = Path(path)
+    try:
+        return str(path), schema_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema file not found: {schema_path}") from None
 
-def load_test_schema():
-    """Load the test JSON schema file."""
-    schema_path = Path(SCHEMA_PATH)
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_path}")
-    with open(schema_path, "r") as f:
-        return json.load(f)
 
+# The loaders below are keyed on a `get_schema_stamp()` result, so an edited schema file
+# gets fresh entries while anything still being built from the old version stays under
+# the old key (a cheap stat per request when nothing changed)
 
-def get_default_values_from_schema(schema):
-    """Extract default values from a JSON schema."""
-    values = {}
-    properties = schema.get("properties", {})
+@lru_cache(maxsize=1)
+def load_schema(stamp):
+    """Load and parse a version of a schema file."""
+    path, _ = stamp
+    return orjson.loads(Path(path).read_bytes())
 
-    for prop_name, prop_schema in properties.items():
-        if "default" in prop_schema:
-            values[prop_name] = prop_schema["default"]
 
-    return values
+@lru_cache(maxsize=1)
+def load_schema_properties(stamp):
+    """Parse a schema file version's properties into `SchemaProperty` objects."""
+    return tuple(SchemaParser(load_schema(stamp)).properties)
 
 
-@rt("/")
-def index():
-    """Main page showing the generated form."""
-    # Load the schema
-    schema = load_test_schema()
+# Longest array field input handed to the Python parser
+MAX_ARRAY_INPUT = 10_000
+
+
+def parse_array(value):
+    """Parse an array field's input, which is rendered with its Python repr, back into a list."""
+    # Deeply nested or very long input can overflow the parser (MemoryError/RecursionError)
+    if len(value) > MAX_ARRAY_INPUT:
+        return value
+    try:
+        parsed = ast.literal_eval(value)
+    except (MemoryError, RecursionError):
+        return value
+    # literal_eval accepts any Python literal; keep only JSON-compatible lists and leave
+    # anything else as the raw string for the validator to reject
+    if not isinstance(parsed, list):
+        return value
+    try:
+        orjson.dumps(parsed)
+    except TypeError:
+        return value
+    return parsed
+
 
-    # Get default values from the schema itself
-    example_values = get_default_values_from_schema(schema)
+def parse_number(value):
+    """Parse a number field's input, rejecting values JSON can't represent."""
+    number = float(value)
+    # NaN passes every minimum/maximum check and orjson would write it (and infinity) as null
+    if not math.isfinite(number):
+        raise ValueError(f"Not a finite number: {value!r}")
+    return number
 
+
+# Form value converters by JSON Schema type
+FORM_CONVERTERS = {"integer": int, "number": parse_number, "array": parse_array}
+
+
+def convert_nullable(convert, value):
+    """Treat an empty input as null for a nullable field, otherwise apply `convert` if given."""
+    if value == "":
+        return None
+    return convert(value) if convert is not None else value
+
+
+def get_property_types(properties):
+    """Group property names by the handling they need when a form is submitted."""
+    bool_names = []
+    convert_names = []
+    convert_funcs = []
+    for prop in properties:
+        prop_type = prop.type  # Resolves nullable types like ["integer", "null"]
+        if prop_type == "boolean":
+            bool_names.append(prop.name)
+            continue
+        convert = FORM_CONVERTERS.get(prop_type)
+        if prop.is_nullable:
+            convert = partial(convert_nullable, convert)
+        if convert is not None:
+            convert_names.append(prop.name)
+            convert_funcs.append(convert)
+
+    # Parallel tuples keep submit() to a tight loop over just the typed fields
+    return {
+        "bool": tuple(bool_names),
+        "convert_names": tuple(convert_names),
+        "convert_funcs": tuple(convert_funcs),
+    }
+
+
+@lru_cache(maxsize=1)
+def load_property_types(stamp):
+    """Compute the property type groups for a schema file version."""
+    return get_property_types(load_schema_properties(stamp))
+
+
+def get_default_values(properties):
+    """Extract default values from parsed schema properties."""
+    return {prop.name: prop.default for prop in properties if "default" in prop.schema}
+
+
+@lru_cache(maxsize=1)
+def load_default_values(stamp):
+    """Extract the default values for a schema file version."""
+    return get_default_values(load_schema_properties(stamp))
+
+
+def build_index_page(schema, example_values):
+    """Build the main page content showing the form generated from `schema`."""
     # Generate the form UI
     form_ui = generate_form_ui(
         schema=schema,
@@ -86,39 +245,18 @@ def index():
         Div(
             Div(
                 Div(
-                    H1("JSON Schema to FastHTML UI Demo",
-                    cls=combine_classes(
-                        font_size.lg,          # Smaller on mobile
-                        font_size.xl.sm,       # Medium on small screens
-                        font_size._2xl.md,     # Large on medium+ screens
-                        font_weight.bold,
-                        text_dui.base_content
-                    )),
-                    cls=str(navbar_start)
+                    H1("JSON Schema to FastHTML UI Demo", cls=_TITLE_CLS),
+                    cls=_NAVBAR_START_CLS
                 ),
                 Div(
                     create_theme_selector(),
-                    cls=combine_classes(
-                        flex_display,
-                        justify.end,
-                        items.center,
-                        gap(2),               # Smaller gap on mobile
-                        gap(4).sm,            # Normal gap on small+
-                        navbar_end
-                    )
+                    cls=_NAVBAR_END_CLS
                 ),
-                cls=combine_classes(
-                    navbar,
-                    bg_dui.base_100,
-                    p(0)
-                )
+                cls=_NAVBAR_CLS
             ),
             P(
                 "This demo shows a configuration form generated from a JSON Schema",
-                cls=combine_classes(
-                    font_size.lg,
-                    m.b(8)
-                )
+                cls=_INTRO_CLS
             ),
         ),
         
@@ -132,14 +270,14 @@ def index():
                 Button(
                     "Save Configuration",
                     type="submit",
-                    cls=combine_classes(btn, btn_colors.primary)
+                    cls=_BTN_PRIMARY_CLS
                 ),
                 Button(
                     "Reset",
                     type="reset",
-                    cls=combine_classes(btn, btn_styles.ghost, m.l(2))
+                    cls=_BTN_GHOST_CLS
                 ),
-                cls=combine_classes(m.t(6))
+                cls=_SECTION_CLS
             ),
 
             # Form submission handler
@@ -149,76 +287,233 @@ def index():
         ),
 
         # Result display area
-        Div(id="result", cls=combine_classes(m.t(6))),
+        Div(id="result", cls=_SECTION_CLS),
 
-        cls=combine_classes(
-            container,
-            max_w._6xl,
-            m.x.auto,
-            p(6)
-        )
+        cls=_CONTAINER_CLS
     )
 
 
-@rt("/submit", methods=["POST"])
-async def submit(request):
-    """Handle form submission."""
-    form_data = await request.form()
+def render_page(*content, path="/"):
+    """Render `content` as a full HTML page the way FastHTML wraps a route's response."""
+    # Same head/body layout as FastHTML's `respond()`, with two differences since the page
+    # is rendered once and shared by every request: the canonical link is the page's path
+    # rather than the request's absolute URL, and `body_wrap` gets no request object
+    heads = [Title(app.title)]
+    if getattr(app, "canonical", False):
+        heads.append(Link(rel="canonical", href=path))
+    body_wrap = getattr(app, "body_wrap", None)
+    if body_wrap is not None:
+        wrap_args = (content, None) if len(inspect.signature(body_wrap).parameters) > 1 else (content,)
+        content = (body_wrap(*wrap_args),)
+    return to_xml(Html(
+        Head(*heads, *flat_xt(app.hdrs)),
+        Body(*content, *flat_xt(app.ftrs), **app.bodykw),
+        **app.htmlkw
+    ))
+
+
+def compress_page(page_html):
+    """Encode a rendered page as raw, brotli, and gzip bodies keyed by content encoding."""
+    body = page_html.encode()
+    return {
+        "br": brotli.compress(body, quality=11),
+        "gzip": gzip.compress(body, compresslevel=9),
+        "identity": body,
+    }
+
+
+def pick_encoding(accept_encoding):
+    """Choose the best precompressed encoding allowed by an `Accept-Encoding` header."""
+    accepted = set()
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        quality = params.replace(" ", "").removeprefix("q=") or "1"
+        try:
+            if float(quality) > 0:
+                accepted.add(coding.strip().lower())
+        except ValueError:
+            pass
+    for coding in ("br", "gzip"):
+        if coding in accepted:
+            return coding
+    return "identity"
+
+
+def etag_matches(if_none_match, etag):
+    """Check whether an `If-None-Match` header matches `etag` (weak comparison)."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def tag_bodies(page_html):
+    """Compress a rendered page and give each encoding its own strong ETag."""
+    digest = hashlib.sha256(page_html.encode()).hexdigest()[:16]
+    # Each encoding is a different representation, so each gets its own tag
+    bodies = compress_page(page_html)
+    etags = {encoding: f'"{digest}-{encoding}"' for encoding in bodies}
+    return bodies, etags
+
+
+@lru_cache(maxsize=1)
+def load_index_page(stamp):
+    """Render, compress, and tag the main page for a schema file version."""
+    page = build_index_page(load_schema(stamp), load_default_values(stamp))
+    # Like FastHTML, htmx requests get just the content without the page wrapper
+    return {"page": tag_bodies(render_page(page)), "fragment": tag_bodies(to_xml(page))}
 
-    # Convert form data to dict
-    config = dict(form_data)
 
-    # Handle boolean fields (checkboxes)
-    schema = load_test_schema()
-    for prop_name, prop_schema in schema.get("properties", {}).items():
-        if prop_schema.get("type") == "boolean":
-            # Checkbox fields only appear in form data if checked
-            config[prop_name] = prop_name in config
+@rt("/")
+def index(request):
+    """Main page showing the generated form."""
+    # Picks up edits to the schema file
+    stamp = get_schema_stamp(SCHEMA_PATH)
+
+    # The page only depends on the schema, so serve pre-rendered, precompressed HTML
+    variant = "fragment" if "hx-request" in request.headers else "page"
+    bodies, etags = load_index_page(stamp)[variant]
+    encoding = pick_encoding(request.headers.get("accept-encoding", ""))
+    headers = {
+        "vary": "Accept-Encoding, HX-Request",
+        "etag": etags[encoding],
+        # Let browsers keep the page but revalidate it, so repeat views can skip the body
+        "cache-control": "no-cache",
+    }
+    if etag_matches(request.headers.get("if-none-match", ""), etags[encoding]):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["content-encoding"] = encoding
+    return Response(bodies[encoding], media_type="text/html", headers=headers)
+
+
+@lru_cache(maxsize=1)
+def load_validator(stamp):
+    """Build a JSON Schema validator for a schema file version."""
+    schema = load_schema(stamp)
+    return validator_for(schema)(schema)
+
+
+def build_error_panel(messages):
+    """Build the panel listing why a submitted configuration is invalid."""
+    return Div(
+        H3("Invalid Configuration:", cls=_RESULT_TITLE_CLS),
+        Ul(*[Li(message) for message in messages]),
+        cls=_ERROR_CLS
+    )
 
-    # Convert numeric fields
-    for prop_name, prop_schema in schema.get("properties", {}).items():
-        if prop_name in config:
-            if prop_schema.get("type") == "integer":
-                try:
-                    config[prop_name] = int(config[prop_name])
-                except (ValueError, TypeError):
-                    pass
-            elif prop_schema.get("type") == "number":
-                try:
-                    config[prop_name] = float(config[prop_name])
-                except (ValueError, TypeError):
-                    pass
-
-    # Return formatted result
+
+def build_validation_errors(errors):
+    """Build the error panel for JSON Schema validation errors."""
+    return build_error_panel(
+        f"{'/'.join(map(str, error.absolute_path)) or '(root)'}: {error.message}"
+        for error in errors
+    )
+
+
+def build_submit_result(config_json):
+    """Build the result panel showing the submitted configuration."""
     return Div(
-        H3("Submitted Configuration:", cls=combine_classes(font_weight.bold, m.b(2))),
-        Pre(
-            json.dumps(config, indent=2),
-            cls=combine_classes(
-                bg_dui.base_100,
-                p(4),
-                "rounded-lg",
-                "overflow-auto"
-            )
-        ),
-        cls=combine_classes(
-            bg_dui.success.opacity(10),
-            "border",
-            "border-success",
-            p(4),
-            "rounded-lg"
-        )
+        H3("Submitted Configuration:", cls=_RESULT_TITLE_CLS),
+        Pre(config_json, cls=_RESULT_PRE_CLS),
+        cls=_RESULT_CLS
     )
 
 
+# Only the JSON varies between submissions, so render the panel once around a marker
+_SUBMIT_MARKER = "__SUBMITTED_CONFIG__"
+SUBMIT_PREFIX, SUBMIT_SUFFIX = (
+    part.encode() for part in to_xml(build_submit_result(_SUBMIT_MARKER), indent=False).split(_SUBMIT_MARKER)
+)
+
+
+def get_form_config(form_data, prop_types):
+    """Build a config dict from submitted form data, converting typed fields."""
+    # One pass over the form's (key, value) list (later duplicates win, as with dict(form_data)),
+    # then convert only the fields that need it
+    config = dict(form_data.multi_items())
+    for prop_name, convert in zip(prop_types["convert_names"], prop_types["convert_funcs"]):
+        if prop_name in config:
+            try:
+                config[prop_name] = convert(config[prop_name])
+            except (ValueError, TypeError, SyntaxError):
+                pass
+
+    # Checkbox fields only appear in form data if checked
+    for prop_name in prop_types["bool"]:
+        config[prop_name] = prop_name in config
+
+    return config
+
+
+async def submit(request):
+    """Handle form submission (form-encoded or JSON)."""
+    # Picks up edits to the schema file
+    stamp = get_schema_stamp(SCHEMA_PATH)
+
+    if request.headers.get("content-type", "").startswith("application/json"):
+        # JSON clients already send typed values, so skip form parsing and coercion
+        try:
+            config = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            return Response("Invalid JSON body", status_code=400)
+        if not isinstance(config, dict):
+            return Response("JSON body must be an object", status_code=422)
+    else:
+        config = get_form_config(await request.form(), load_property_types(stamp))
+
+    # Validate against the schema before echoing the config back
+    errors = sorted(
+        load_validator(stamp).iter_errors(config),
+        key=lambda error: [str(part) for part in error.absolute_path]
+    )
+    if errors:
+        return HTMLResponse(to_xml(build_validation_errors(errors)))
+
+    # Return formatted result (orjson rejects some values json.dumps allowed, e.g. integers over 64 bits)
+    try:
+        config_json = orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+    except TypeError as e:
+        return HTMLResponse(to_xml(build_error_panel([f"Cannot serialize the configuration: {e}"])))
+    config_json = html.escape(config_json, quote=False)
+    return Response(SUBMIT_PREFIX + config_json.encode() + SUBMIT_SUFFIX, media_type="text/html")
+
+
+# A plain Starlette route: FastHTML's handler wrapper would parse the body (form or JSON)
+# before `submit` runs, parsing JSON twice and turning bad bodies into 500s
+app.routes.append(Route("/submit", submit, methods=["POST"]))
+
+
 def open_browser(url):
     # Open in default browser
     print(f"Opening in browser at {url}")
     webbrowser.open(url)
 
-if __name__ == "__main__":
-    import threading
 
+# uvloop isn't available on Windows
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
+
+def report_browser_error(task):
+    """Print why the browser couldn't be opened, instead of leaving the task's error unretrieved."""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Could not open browser: {task.exception()}")
+
+
+async def serve_and_open_browser(config, url):
+    """Run a uvicorn server, opening the browser once it is accepting connections."""
+    server = uvicorn.Server(config)
+    serve_task = asyncio.create_task(server.serve())
+    # `started` is only set after uvicorn has bound its sockets
+    while not server.started and not serve_task.done():
+        await asyncio.sleep(0.05)
+    if server.started:
+        # Off the event loop, since console browsers block until they exit
+        # (the reference keeps the task from being garbage collected while it runs)
+        browser_task = asyncio.create_task(asyncio.to_thread(open_browser, url))
+        browser_task.add_done_callback(report_browser_error)
+    await serve_task
+
+
+if __name__ == "__main__":
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="JSON Schema to UI Demo Application")
     parser.add_argument(
@@ -239,11 +534,19 @@ if __name__ == "__main__":
         default="0.0.0.0",
         help="Host to run the server on (default: 0.0.0.0)"
     )
+    parser.add_argument(
+        "--no-browser",
+        dest="open_browser",
+        action="store_false",
+        help="Don't open a browser; serve with one worker per CPU instead"
+    )
 
     args = parser.parse_args()
+    local_url = f"http://localhost:{args.port}"
 
-    # Set the global schema path
+    # Set the global schema path (and export it for worker processes)
     SCHEMA_PATH = args.schema
+    os.environ[SCHEMA_PATH_ENV] = str(Path(SCHEMA_PATH).absolute())
 
     # Verify schema file exists
     if not Path(SCHEMA_PATH).exists():
@@ -255,16 +558,15 @@ if __name__ == "__main__":
 
     # Load and display schema info
     try:
-        with open(SCHEMA_PATH, "r") as f:
-            schema_data = json.load(f)
-            schema_title = schema_data.get("title", "Unknown")
-            schema_desc = schema_data.get("description", "No description")
+        # Goes through the same cache the routes use, so the file is only parsed once
+        schema_data = load_schema(get_schema_stamp(SCHEMA_PATH))
+        schema_title = schema_data.get("title", "Unknown")
+        schema_desc = schema_data.get("description", "No description")
     except Exception as e:
         print(f"Error loading schema: {e}")
         sys.exit(1)
 
     # Run the app
-    import uvicorn
     print("\n" + "="*60)
     print("JSON Schema to UI Demo App")
     print("="*60)
@@ -273,14 +575,37 @@ if __name__ == "__main__":
     print(f"Description: {schema_desc}")
     print(f"\nServer: http://{args.host}:{args.port}")
     print("\nAvailable routes:")
-    print(f"  http://localhost:{args.port}/          - Main demo with pre-filled form")
-    print(f"  http://localhost:{args.port}/empty     - Empty form without values")
-    print(f"  http://localhost:{args.port}/compact   - Compact form layout")
+    print(f"  {local_url}/          - Main demo with pre-filled form")
+    print(f"  {local_url}/empty     - Empty form without values")
+    print(f"  {local_url}/compact   - Compact form layout")
     print("\n" + "="*60 + "\n")
 
-    # Open browser after a short delay
-    timer = threading.Timer(1.5, lambda: open_browser(f"http://localhost:{args.port}"))
-    timer.daemon = True
-    timer.start()
-
-    uvicorn.run(app, host=args.host, port=args.port)
\ No newline at end of file
+    if args.open_browser:
+        config = uvicorn.Config(
+            app,
+            host=args.host,
+            port=args.port,
+            loop=UVICORN_LOOP,
+            http="httptools",
+            log_level="warning"
+        )
+        loop_factory = None
+        if UVICORN_LOOP == "uvloop":
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        # Ctrl+C ends the run quietly, as it does with uvicorn.run
+        try:
+            asyncio.run(serve_and_open_browser(config, local_url), loop_factory=loop_factory)
+        except KeyboardInterrupt:
+            pass
+    else:
+        # Multiple workers need an import string so each process can load the app itself
+        uvicorn.run(
+            f"{Path(__file__).stem}:app",
+            host=args.host,
+            port=args.port,
+            loop=UVICORN_LOOP,
+            http="httptools",
+            workers=os.cpu_count() or 1,
+            log_level="warning"
+        )
@@ -0,0 +1,43 @@
+"""Tests for the demo application's routes."""
+
+import os
+from pathlib import Path
+
+# The demo reads its schema path from the environment at import time
+os.environ["JSONSCHEMA_DEMO_SCHEMA"] = str(Path(__file__).absolute().parent / "test_files" / "voxtral_config_schema.json")
+
+from starlette.testclient import TestClient
+
+import demo_app
+
+client = TestClient(demo_app.app)
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def test_submit_json_object():
+    response = client.post("/submit", json={"model_id": "mistralai/Voxtral-Mini-3B-2507", "temperature": 0.5})
+    assert response.status_code == 200
+    assert "Submitted Configuration:" in response.text
+    assert '"temperature": 0.5' in response.text
+
+
+def test_submit_malformed_json():
+    response = client.post("/submit", content=b"{bad", headers=JSON_HEADERS)
+    assert response.status_code == 400
+
+
+def test_submit_non_object_json():
+    response = client.post("/submit", content=b"[1,2]", headers=JSON_HEADERS)
+    assert response.status_code == 422
+
+
+def test_submit_form_rejects_nan():
+    response = client.post("/submit", data={"model_id": "mistralai/Voxtral-Mini-3B-2507", "temperature": "nan"})
+    assert response.status_code == 200
+    assert "Invalid Configuration:" in response.text
+
+
+def test_submit_form_deeply_nested_array():
+    data = {"model_id": "mistralai/Voxtral-Mini-3B-2507", "allowed_extensions": "[" * 5000 + "]" * 5000}
+    response = client.post("/submit", data=data)
+    assert response.status_code == 200